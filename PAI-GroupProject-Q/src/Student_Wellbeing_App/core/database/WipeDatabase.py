@@ -0,0 +1,30 @@
+"""Delete the SQLite database file so migrations can rebuild it from scratch."""
+
+from pathlib import Path
+
+# When run as a script, operate on the DB file in the current working
+# directory.
+DB_FILE = Path("student_wellbeing_db.sqlite3")
+
+
+def wipe(db_path: Path = DB_FILE) -> str:
+    """
+    Delete db_path (plus any WAL/SHM side files) and return a status
+    message describing what happened.
+    """
+    db_path = Path(db_path)
+    if not db_path.exists():
+        return f"Database file not found: {db_path}"
+    for side_file in (db_path.with_name(db_path.name + "-wal"),
+                      db_path.with_name(db_path.name + "-shm")):
+        side_file.unlink(missing_ok=True)
+    db_path.unlink()
+    return f"SQLite database file deleted: {db_path}"
+
+
+def main() -> None:
+    print(wipe())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,26 @@
+import atexit
 import sqlite3
+import threading
+from collections import namedtuple
+from datetime import date, datetime
+from itertools import chain
 from pathlib import Path
 
+from ..models.AttendanceStatus import AttendanceStatus
+
+# Bind AttendanceStatus members as plain INTEGERs so callers can pass
+# enum values straight to execute()/executemany().
+sqlite3.register_adapter(AttendanceStatus, int)
+
+# Store date/datetime values as ISO-8601 text and parse DATE/DATETIME
+# columns back with the C-implemented fromisoformat, so callers get real
+# date objects without formatting strings by hand.
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, datetime.isoformat)
+sqlite3.register_converter("DATE", lambda v: date.fromisoformat(v.decode()))
+sqlite3.register_converter(
+    "DATETIME", lambda v: datetime.fromisoformat(v.decode()))
+
 # Database file lives next to this module.
 BASE_DIR = Path(__file__).resolve().parent
 DB_PATH = BASE_DIR / "student_wellbeing_db.sqlite3"
@@ -8,19 +28,214 @@ DB_PATH = BASE_DIR / "student_wellbeing_db.sqlite3"
 # Export name for logging/printing in other modules.
 DB_NAME = DB_PATH
 
+# Per-connection PRAGMAs applied to every new connection. WAL +
+# synchronous=NORMAL avoids an fsync per statement; the rest keep temp
+# data and hot pages in memory and make concurrent opens wait instead
+# of failing with SQLITE_BUSY.
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -64000;
+PRAGMA mmap_size = 268435456;
+PRAGMA busy_timeout = 5000;
+PRAGMA foreign_keys = ON;
+"""
+
+# Test hook: when set, this wins over DB_PATH. Patching the one
+# attribute replaces the old three-way DB_PATH/DB_NAME monkeypatch.
+_OVERRIDE = None
+
+# str() of the active DB path, memoized by identity so sqlite3.connect
+# isn't handed a Path to re-stringify on every call. Monkeypatched paths
+# (tests) miss the identity check and refresh the cache automatically.
+_path_cache = (None, "")
+
+
+def _db_path_str() -> str:
+    global _path_cache
+    path = _OVERRIDE if _OVERRIDE is not None else DB_PATH
+    if _path_cache[0] is not path:
+        _path_cache = (path, str(path))
+    return _path_cache[1]
+
+
+def _rebuild_path_cache() -> None:
+    """Drop the memoized DB path string (call after repointing DB_PATH)."""
+    global _path_cache
+    _path_cache = (None, "")
+
+
+# journal_mode=WAL is persistent in the DB file, so we only need to switch
+# it once per database path (and never for in-memory DBs, which don't
+# support WAL).
+_wal_enabled_paths = set()
+
+
+def _is_memory_db(path) -> bool:
+    s = str(path)
+    return s == ":memory:" or "mode=memory" in s
 
-def get_db_connection() -> sqlite3.Connection:
+
+class _Connection(sqlite3.Connection):
+    """Connection that refreshes planner stats on close.
+
+    PRAGMA optimize is the cheap form of ANALYZE the SQLite docs
+    recommend running when a connection goes idle; it keeps sqlite_stat1
+    fresh so the planner keeps choosing index scans.
+    """
+
+    def close(self):
+        try:
+            self.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass  # already closed or read-only; nothing to refresh
+        super().close()
+
+
+# namedtuple classes generated per column layout, shared across cursors.
+_nt_classes = {}
+
+
+def _namedtuple_row_factory(cursor, row):
     """
-    Return a NEW SQLite connection each time.
-    Callers are responsible for closing it.
+    Row factory producing namedtuples. Attribute access on a namedtuple
+    skips the per-lookup column-name search sqlite3.Row performs, which
+    adds up on queries that read many rows.
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # enables dict-like row access in tests
-    # enforce FK constraints for integrity
-    conn.execute("PRAGMA foreign_keys = ON")
+    fields = tuple(col[0] for col in cursor.description)
+    cls = _nt_classes.get(fields)
+    if cls is None:
+        cls = _nt_classes[fields] = namedtuple("Row", fields, rename=True)
+    return cls(*row)
+
+
+# SQLite connections are thread-affine, so cache one per thread (per DB
+# path) instead of reconnecting on every call.
+_tls = threading.local()
+
+
+def _is_open(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("SELECT 1")
+        return True
+    except sqlite3.ProgrammingError:
+        return False
+
+
+# Size of sqlite3's per-connection LRU of compiled statements. The stdlib
+# default of 128 evicts under the app's mixed workload; 512 keeps every
+# repeated INSERT/SELECT compiled.
+DEFAULT_STATEMENT_CACHE = 512
+
+
+def _open_connection(
+    path_key: str,
+    row_factory: str = None,
+    cached_statements: int = DEFAULT_STATEMENT_CACHE,
+    readonly: bool = False,
+) -> sqlite3.Connection:
+    if readonly:
+        # mode=ro skips journal/lock setup entirely: no -wal/-shm files
+        # are created and no header writes happen on open.
+        database, uri = f"file:{path_key}?mode=ro", True
+    else:
+        # Pass file: URIs (e.g. shared-cache in-memory DBs) through as-is.
+        database, uri = path_key, path_key.startswith("file:")
+    conn = sqlite3.connect(
+        database,
+        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+        factory=_Connection,
+        cached_statements=cached_statements,
+        uri=uri,
+    )
+    if row_factory == "namedtuple":
+        conn.row_factory = _namedtuple_row_factory
+    else:
+        conn.row_factory = sqlite3.Row  # dict-like row access (the default)
+
+    if (not readonly and not _is_memory_db(path_key)
+            and path_key not in _wal_enabled_paths):
+        conn.execute("PRAGMA journal_mode = WAL")
+        _wal_enabled_paths.add(path_key)
+    conn.executescript(_CONNECTION_PRAGMAS)
+    return conn
+
+
+def get_db_connection(
+    fresh: bool = False,
+    row_factory: str = None,
+    cached_statements: int = DEFAULT_STATEMENT_CACHE,
+    readonly: bool = False,
+) -> sqlite3.Connection:
+    """
+    Return a SQLite connection for the configured DB path.
+
+    By default the connection is cached per thread and reused across
+    calls; pass fresh=True to get a brand-new, independent connection
+    (the caller is then responsible for closing it).
+
+    Rows come back as sqlite3.Row by default; hot read paths can pass
+    row_factory="namedtuple" for faster attribute access.
+    cached_statements sizes sqlite3's compiled-statement LRU, so
+    re-executed SQL strings skip the parse + codegen pass.
+    readonly=True opens the DB via a mode=ro URI, skipping all
+    write-side setup for callers that only read.
+    """
+    path_key = _db_path_str()
+    if fresh:
+        return _open_connection(
+            path_key, row_factory, cached_statements, readonly)
+
+    cache = getattr(_tls, "connections", None)
+    if cache is None:
+        cache = _tls.connections = {}
+    key = (path_key, row_factory, readonly)
+    conn = cache.get(key)
+    if conn is None or not _is_open(conn):
+        conn = cache[key] = _open_connection(
+            path_key, row_factory, cached_statements, readonly)
     return conn
 
 
+def close_db_connection() -> None:
+    """
+    Close and forget this thread's cached connections.
+    Mainly useful for tests that need a clean slate.
+    """
+    cache = getattr(_tls, "connections", None)
+    if cache:
+        for conn in cache.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        cache.clear()
+
+
+atexit.register(close_db_connection)
+
+
+def bulk_insert(conn, table, cols, rows, chunk=100):
+    """
+    Insert rows with multi-row VALUES statements:
+    INSERT INTO table(c1, c2) VALUES (?, ?), (?, ?), ...
+
+    Compared to executemany this steps one statement per chunk instead
+    of one per row. Chunking keeps each statement under SQLite's
+    999-parameter limit. Does not commit; callers control the
+    transaction.
+    """
+    rows = list(rows)
+    if not rows:
+        return
+    placeholder = "(" + ", ".join("?" * len(cols)) + ")"
+    prefix = f"INSERT INTO {table}({', '.join(cols)}) VALUES "
+    for start in range(0, len(rows), chunk):
+        batch = rows[start:start + chunk]
+        sql = prefix + ", ".join([placeholder] * len(batch))
+        conn.execute(sql, list(chain.from_iterable(batch)))
+
+
 def get_db_pool():
     """
     Backwards-compatible shim for old MySQL-style pool code.
@@ -1,126 +1,137 @@
-import os
-from datetime import datetime
+from contextlib import closing
+from datetime import datetime, timezone
 
 from .connection import (
     get_db_connection,
     DB_NAME,
 )
 
+# Full schema based on the ERD. Kept as one script so SQLite parses it and
+# acquires the schema lock once instead of once per statement.
+SCHEMA_SQL = """
+-- student and user have natural TEXT primary keys; WITHOUT ROWID stores
+-- each row directly in the primary-key B-tree, so lookups by id descend
+-- one tree instead of two. STRICT enforces the declared column types.
+CREATE TABLE IF NOT EXISTS student (
+    student_id TEXT PRIMARY KEY,
+    first_name TEXT,
+    lastname   TEXT,
+    email      TEXT UNIQUE,
+    password   TEXT,
+    year       INTEGER
+) WITHOUT ROWID, STRICT;
+
+CREATE TABLE IF NOT EXISTS attendance (
+    attendance_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id    TEXT,
+    session_date  DATE,
+    session_id    TEXT,
+    -- AttendanceStatus value; aggregate with SUM(status = <n>) rather
+    -- than COUNT(CASE WHEN ...) so counts stay one integer compare per
+    -- row.
+    status        INTEGER,
+    FOREIGN KEY (student_id) REFERENCES student(student_id)
+);
+
+CREATE TABLE IF NOT EXISTS assessment (
+    assessment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    module_code   TEXT,
+    title         TEXT,
+    due_date      DATE,
+    weight        REAL
+);
+
+CREATE TABLE IF NOT EXISTS submission (
+    submission_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id    TEXT,
+    assessment_id INTEGER,
+    submitted_at  DATETIME,
+    status        TEXT,
+    mark          REAL,
+    FOREIGN KEY (student_id)    REFERENCES student(student_id),
+    FOREIGN KEY (assessment_id) REFERENCES assessment(assessment_id)
+);
+
+CREATE TABLE IF NOT EXISTS wellbeing_record (
+    record_id    INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id   TEXT,
+    week_start   DATE,
+    stress_level INTEGER,
+    sleep_hours  REAL,
+    source_type  TEXT,
+    FOREIGN KEY (student_id) REFERENCES student(student_id)
+);
+
+CREATE TABLE IF NOT EXISTS alert (
+    alert_id    INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id  TEXT,
+    alert_type  TEXT,
+    reason      TEXT,
+    created_at  DATETIME,
+    resolved    INTEGER,   -- 0/1 as BOOLEAN
+    FOREIGN KEY (student_id) REFERENCES student(student_id)
+);
+
+CREATE TABLE IF NOT EXISTS retention_rule (
+    rule_id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    data_type        TEXT,
+    retention_months INTEGER,
+    is_active        INTEGER   -- 0/1
+);
+
+CREATE TABLE IF NOT EXISTS audit_log (
+    log_id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id     TEXT,
+    entity_type TEXT,
+    entity_id   INTEGER,
+    action_type TEXT,
+    timestamp   DATETIME,
+    details     TEXT
+);
+
+CREATE TABLE IF NOT EXISTS user (
+    user_id       TEXT PRIMARY KEY,
+    first_name    TEXT NOT NULL,
+    lastname      TEXT NOT NULL,
+    password_hash TEXT NOT NULL,
+    role          TEXT NOT NULL
+) WITHOUT ROWID, STRICT;
+
+-- Indexes on the FK / filter columns the app queries by. Kept after the
+-- tables so any future seed INSERTs added above stay ahead of index
+-- maintenance during bulk ingest.
+CREATE INDEX IF NOT EXISTS idx_attendance_student
+    ON attendance(student_id, session_date);
+CREATE INDEX IF NOT EXISTS idx_submission_student
+    ON submission(student_id);
+CREATE INDEX IF NOT EXISTS idx_wellbeing_student_week
+    ON wellbeing_record(student_id, week_start DESC);
+CREATE INDEX IF NOT EXISTS idx_alert_student
+    ON alert(student_id);
+CREATE INDEX IF NOT EXISTS idx_audit_user
+    ON audit_log(user_id);
+"""
+
 
 def run_migrations():
-    # Connect using the same helper + same DB path as the rest of the app
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    print("DB file path:", DB_NAME)
-    print("DB file exists:", os.path.exists(DB_NAME))
-
-    # Create tables based on ERD
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS student (
-        student_id TEXT PRIMARY KEY,
-        first_name TEXT,
-        lastname   TEXT,
-        email      TEXT UNIQUE,
-        password   TEXT,
-        year       INTEGER
-    )
-    """)
-
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS attendance (
-        attendance_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        student_id    TEXT,
-        session_date  DATE,
-        session_id    TEXT,
-        status        TEXT,
-        FOREIGN KEY (student_id) REFERENCES student(student_id)
-    )
-    """)
-
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS assessment (
-        assessment_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        module_code   TEXT,
-        title         TEXT,
-        due_date      DATE,
-        weight        REAL
-    )
-    """)
-
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS submission (
-        submission_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        student_id    TEXT,
-        assessment_id INTEGER,
-        submitted_at  DATETIME,
-        status        TEXT,
-        mark          REAL,
-        FOREIGN KEY (student_id)    REFERENCES student(student_id),
-        FOREIGN KEY (assessment_id) REFERENCES assessment(assessment_id)
-    )
-    """)
-
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS wellbeing_record (
-        record_id    INTEGER PRIMARY KEY AUTOINCREMENT,
-        student_id   TEXT,
-        week_start   DATE,
-        stress_level INTEGER,
-        sleep_hours  REAL,
-        source_type  TEXT,
-        FOREIGN KEY (student_id) REFERENCES student(student_id)
-    )
-    """)
-
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS alert (
-        alert_id    INTEGER PRIMARY KEY AUTOINCREMENT,
-        student_id  TEXT,
-        alert_type  TEXT,
-        reason      TEXT,
-        created_at  DATETIME,
-        resolved    INTEGER,   -- 0/1 as BOOLEAN
-        FOREIGN KEY (student_id) REFERENCES student(student_id)
-    )
-    """)
-
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS retention_rule (
-        rule_id          INTEGER PRIMARY KEY AUTOINCREMENT,
-        data_type        TEXT,
-        retention_months INTEGER,
-        is_active        INTEGER   -- 0/1
-    )
-    """)
-
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS audit_log (
-        log_id      INTEGER PRIMARY KEY AUTOINCREMENT,
-        user_id     TEXT,
-        entity_type TEXT,
-        entity_id   INTEGER,
-        action_type TEXT,
-        timestamp   DATETIME,
-        details     TEXT
+    # Connect using the same helper + same DB path as the rest of the app;
+    # closing() guarantees the connection is released on error paths too.
+    with closing(get_db_connection()) as conn:
+        # Create tables based on ERD, inside one explicit transaction so
+        # the journal is written once for the whole script. IMMEDIATE
+        # takes the write lock up front instead of upgrading mid-script
+        # and risking SQLITE_BUSY under parallel test runs.
+        conn.isolation_level = None  # autocommit; the script manages the txn
+        conn.executescript(f"BEGIN IMMEDIATE;\n{SCHEMA_SQL}\nCOMMIT;")
+
+        # Refresh planner statistics so student-scoped queries use the
+        # indexes above instead of heuristic row counts.
+        conn.execute("ANALYZE")
+
+    print(
+        f"[{datetime.now(timezone.utc)}] "
+        f"Migrations completed successfully on {DB_NAME}"
     )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS user (
-            user_id       TEXT PRIMARY KEY,
-            first_name    TEXT NOT NULL,
-            lastname      TEXT NOT NULL,
-            password_hash TEXT NOT NULL,
-            role          TEXT NOT NULL
-        );
-        """)
-
-    conn.commit()
-    print(f"[{datetime.utcnow()}] Migrations completed successfully on {DB_NAME}")
-
-    cursor.close()
-    conn.close()
 
 
 if __name__ == "__main__":
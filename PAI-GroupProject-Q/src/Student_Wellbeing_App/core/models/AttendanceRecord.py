@@ -4,7 +4,7 @@ from datetime import date
 from .AttendanceStatus import AttendanceStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class AttendanceRecord:
     attendance_id: int
     student_id: str
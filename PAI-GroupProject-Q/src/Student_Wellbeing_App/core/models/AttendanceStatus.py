@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import IntEnum
 
 
-class AttendanceStatus(str, Enum):
-    PRESENT = "Present"
-    ABSENT = "Absent"
-    EXCUSED = "Excused"
+class AttendanceStatus(IntEnum):
+    PRESENT = 1
+    ABSENT = 2
+    EXCUSED = 3
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from .UserRole import UserRole
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     user_id: str
     first_name: str
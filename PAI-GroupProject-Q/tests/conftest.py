@@ -0,0 +1,128 @@
+"""Shared fixtures for the database test suite.
+
+Running the full migration script for every test is the dominant setup
+cost, so it happens once per session into a template file. Each test
+then gets a private shared-cache in-memory database restored from that
+template with SQLite's backup API: no per-test disk I/O, no journal,
+no fsync.
+"""
+
+import sqlite3
+from itertools import count
+
+import pytest
+
+from Student_Wellbeing_App.core.database import connection as db_conn
+from Student_Wellbeing_App.core.database import migrations
+
+# Each test gets its own URI so shared-cache DBs never collide.
+_memory_db_ids = count()
+
+# Durability is worthless for throwaway test databases: skip fsyncs and
+# keep the rollback journal and temp structures off disk. These are
+# largely no-ops for the in-memory DBs but make the intent explicit and
+# cover any fixture that ends up file-backed.
+_TEST_PRAGMAS = """
+    PRAGMA synchronous = OFF;
+    PRAGMA journal_mode = MEMORY;
+    PRAGMA temp_store = MEMORY;
+"""
+
+
+@pytest.fixture(scope="session")
+def migrated_template(tmp_path_factory):
+    """Run migrations once per session and return the template DB file."""
+    template = tmp_path_factory.mktemp("template") / "template.sqlite3"
+    mp = pytest.MonkeyPatch()
+    mp.setattr(db_conn, "_OVERRIDE", template)
+    try:
+        migrations.run_migrations()
+        db_conn.close_db_connection()
+    finally:
+        mp.undo()
+    return template
+
+
+@pytest.fixture(scope="session")
+def schema_info(migrated_template):
+    """Column metadata for every table, introspected once per session.
+
+    Maps table name -> {column name -> table_info row as dict}, so
+    schema assertions are plain dict lookups with no SQL per test.
+    Rows are read as plain tuples — no Row factory needed for a
+    fixed-shape pragma result.
+    """
+    con = sqlite3.connect(migrated_template)
+    try:
+        tables = [
+            row[0]
+            for row in con.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'")
+        ]
+        # PRAGMA table_info columns: cid, name, type, notnull, dflt_value, pk
+        fields = ("cid", "name", "type", "notnull", "dflt_value", "pk")
+        return {
+            table: {
+                row[1]: dict(zip(fields, row))
+                for row in con.execute(f"PRAGMA table_info({table})")
+            }
+            for table in tables
+        }
+    finally:
+        con.close()
+
+
+@pytest.fixture
+def fresh_db(migrated_template, monkeypatch):
+    """Point the app at a private in-memory copy of the migrated template."""
+    uri = f"file:testdb_{next(_memory_db_ids)}?mode=memory&cache=shared"
+    # The sentinel keeps the shared-cache DB alive for the whole test.
+    sentinel = sqlite3.connect(uri, uri=True)
+    sentinel.executescript(_TEST_PRAGMAS)
+    template_con = sqlite3.connect(migrated_template)
+    try:
+        template_con.backup(sentinel)
+    finally:
+        template_con.close()
+    monkeypatch.setattr(db_conn, "_OVERRIDE", uri)
+    yield uri
+    db_conn.close_db_connection()
+    sentinel.close()
+
+
+@pytest.fixture(scope="session")
+def _shared_memory_db(migrated_template):
+    """One migrated in-memory DB shared by savepoint-isolated tests."""
+    uri = "file:shared_testdb?mode=memory&cache=shared"
+    sentinel = sqlite3.connect(uri, uri=True)
+    sentinel.executescript(_TEST_PRAGMAS)
+    template_con = sqlite3.connect(migrated_template)
+    try:
+        template_con.backup(sentinel)
+    finally:
+        template_con.close()
+    yield uri
+    sentinel.close()
+
+
+@pytest.fixture
+def con(_shared_memory_db, monkeypatch):
+    """A connection whose work is rolled back after the test.
+
+    Each test runs inside a SAVEPOINT on the shared migrated DB; the
+    teardown rollback undoes every insert, so no per-test database has
+    to be built at all. Tests using this fixture must not commit —
+    reads happen on the same connection, so they don't need to.
+    """
+    monkeypatch.setattr(db_conn, "_OVERRIDE", _shared_memory_db)
+    connection = db_conn.get_db_connection(fresh=True)
+    connection.executescript(_TEST_PRAGMAS)
+    # FK enforcement is per-connection; fail fast here rather than in
+    # whichever constraint test happens to run first.
+    assert connection.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    connection.isolation_level = None  # the savepoint owns the transaction
+    connection.execute("SAVEPOINT test_savepoint")
+    yield connection
+    connection.execute("ROLLBACK TO test_savepoint")
+    connection.execute("RELEASE test_savepoint")
+    connection.close()
@@ -1,16 +1,13 @@
 import sqlite3
 import pytest
 
-from ..src.Student_Wellbeing_App.core.database import connection as db_conn
-from ..src.Student_Wellbeing_App.core.database import migrations
+from Student_Wellbeing_App.core.database import connection as db_conn
+from Student_Wellbeing_App.core.database import migrations
 
 
 def _use_temp_db(tmp_path, monkeypatch):
     db_file = tmp_path / "test.sqlite3"
-    monkeypatch.setattr(db_conn, "DB_PATH", db_file)
-    monkeypatch.setattr(db_conn, "DB_NAME", db_file)
-    # keep migrations prints/paths consistent
-    monkeypatch.setattr(migrations, "DB_NAME", db_file)
+    monkeypatch.setattr(db_conn, "_OVERRIDE", db_file)
     return db_file
 
 
@@ -67,15 +64,24 @@ class TestGetDbConnection:
         con.close()
 
     def test_get_db_connection_independent_instances(self, tmp_path, monkeypatch):
-        """Verify each call returns a new independent connection"""
+        """Verify fresh=True returns a new independent connection"""
         _use_temp_db(tmp_path, monkeypatch)
-        con1 = db_conn.get_db_connection()
-        con2 = db_conn.get_db_connection()
+        con1 = db_conn.get_db_connection(fresh=True)
+        con2 = db_conn.get_db_connection(fresh=True)
 
         assert con1 is not con2
         con1.close()
         con2.close()
 
+    def test_get_db_connection_reuses_cached_connection(self, tmp_path, monkeypatch):
+        """Verify repeat calls reuse the thread-cached connection"""
+        _use_temp_db(tmp_path, monkeypatch)
+        con1 = db_conn.get_db_connection()
+        con2 = db_conn.get_db_connection()
+
+        assert con1 is con2
+        db_conn.close_db_connection()
+
     def test_get_db_connection_can_execute_queries(self, tmp_path, monkeypatch):
         """Verify connection can execute and commit queries"""
         _use_temp_db(tmp_path, monkeypatch)
@@ -127,9 +133,9 @@ class TestGetDbPool:
         con.close()
 
     def test_get_db_pool_independent_from_get_db_connection(self, tmp_path, monkeypatch):
-        """Verify pool and direct connection calls return different instances"""
+        """Verify pool and fresh connection calls return different instances"""
         _use_temp_db(tmp_path, monkeypatch)
-        con1 = db_conn.get_db_connection()
+        con1 = db_conn.get_db_connection(fresh=True)
         con2 = db_conn.get_db_pool()
 
         assert con1 is not con2
@@ -1,54 +1,67 @@
-"""Tests for `WipeDatabase.py`.
-
-These tests run the script as a separate process with `cwd` set to a temporary
-folder so the script's relative `DB_FILE = Path("student_wellbeing_db.sqlite3")`
-operates on an isolated file created within the temp dir.
-"""
-
-import sqlite3
-import subprocess
-import sys
-from pathlib import Path
-
-import pytest
-
-
-def _get_script_path():
-    repo_root = Path(__file__).resolve().parent.parent
-    return repo_root / "src" / "Student_Wellbeing_App" / "core" / "database" / "WipeDatabase.py"
-
-
-def test_wipe_database_when_file_missing(tmp_path):
-    """When DB file is absent, script prints a warning and does nothing."""
-    script = _get_script_path()
-
-    # Ensure no DB file in the tmp cwd
-    assert not (tmp_path / "student_wellbeing_db.sqlite3").exists()
-
-    proc = subprocess.run([sys.executable, str(script)], cwd=str(
-        tmp_path), capture_output=True, text=True)
-
-    out = proc.stdout + proc.stderr
-    assert "Database file not found" in out
-    assert not (tmp_path / "student_wellbeing_db.sqlite3").exists()
-
-
-def test_wipe_database_deletes_file(tmp_path):
-    """When DB file exists, script should delete it and print success message."""
-    script = _get_script_path()
-    db_file = tmp_path / "student_wellbeing_db.sqlite3"
-
-    # Create SQLite DB file in the temporary directory
-    conn = sqlite3.connect(db_file)
-    conn.execute("CREATE TABLE demo(id INTEGER PRIMARY KEY)")
-    conn.commit()
-    conn.close()
-
-    assert db_file.exists()
-
-    proc = subprocess.run([sys.executable, str(script)], cwd=str(
-        tmp_path), capture_output=True, text=True)
-
-    out = proc.stdout + proc.stderr
-    assert "SQLite database file deleted" in out
-    assert not db_file.exists()
+"""Tests for `WipeDatabase.py`.
+
+The delete logic is exercised in-process through `wipe()`; one
+subprocess smoke test covers the CLI entry point, which operates on the
+relative `DB_FILE = Path("student_wellbeing_db.sqlite3")` in its cwd.
+"""
+
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from Student_Wellbeing_App.core.database.WipeDatabase import wipe
+
+
+@lru_cache(maxsize=1)
+def _get_script_path():
+    repo_root = Path(__file__).resolve().parent.parent
+    return repo_root / "src" / "Student_Wellbeing_App" / "core" / "database" / "WipeDatabase.py"
+
+
+def test_wipe_database_when_file_missing(tmp_path):
+    """When DB file is absent, wipe reports it and touches nothing."""
+    db_file = tmp_path / "student_wellbeing_db.sqlite3"
+
+    msg = wipe(db_file)
+
+    assert "Database file not found" in msg
+    assert not db_file.exists()
+
+
+def test_wipe_database_deletes_file(tmp_path):
+    """When DB file exists, wipe should delete it and report success."""
+    db_file = tmp_path / "student_wellbeing_db.sqlite3"
+
+    # wipe() only checks for the file's existence, so the SQLite header
+    # bytes are all the fixture data this test needs.
+    db_file.write_bytes(b"SQLite format 3\x00")
+
+    assert db_file.exists()
+
+    msg = wipe(db_file)
+
+    assert "SQLite database file deleted" in msg
+    assert not db_file.exists()
+
+
+def test_wipe_database_script_missing_then_present(tmp_path):
+    """Smoke test: the CLI reports a missing DB, then deletes a present one.
+
+    One test covers both CLI paths so the Python interpreter only has to
+    start twice in total, against the same cwd.
+    """
+    def run_script():
+        proc = subprocess.run(
+            [sys.executable, str(_get_script_path())],
+            cwd=str(tmp_path),
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # Match on raw bytes; decoding the output buys nothing here.
+        return proc.stdout + proc.stderr
+
+    assert b"Database file not found" in run_script()
+
+    db_file = tmp_path / "student_wellbeing_db.sqlite3"
+    db_file.write_bytes(b"SQLite format 3\x00")
+    assert b"SQLite database file deleted" in run_script()
+    assert not db_file.exists()